@@ -21,27 +21,78 @@ from .protocol import OmniLogicProtocol
 
 _LOGGER = logging.getLogger(__name__)
 
+# Every request is rooted in the same namespace.  ElementTree copies the attributes that it is given, so one dict can be shared
+# by all of them
+_REQUEST_ATTRIBUTES = {"xmlns": "http://nextgen.hayward.com/api"}
+
+# The temperature units that the Omni understands
+_VALID_UNITS = frozenset({"F", "C"})
+
+
+def _build_static_request(name: str, with_parameters: bool = False) -> bytes:
+    body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
+
+    name_element = ET.SubElement(body_element, "Name")
+    name_element.text = name
+
+    if with_parameters:
+        ET.SubElement(body_element, "Parameters")
+
+    return ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
+
+
+# These requests do not take any arguments, so their bodies never change and we only need to build them once
+_GET_ALARM_LIST_REQUEST = _build_static_request("GetAllAlarmList")
+_GET_CONFIG_REQUEST = _build_static_request("RequestConfiguration")
+_GET_TELEMETRY_REQUEST = _build_static_request("RequestTelemetryData")
+_RESTORE_IDLE_STATE_REQUEST = _build_static_request("RestoreIdleState", with_parameters=True)
+
+# The scheduling parameters that trail every command that can be run on a timer, in the order that the Omni expects them
+_SCHEDULE_PARAMETERS = (
+    ("IsCountDownTimer", "bool"),
+    ("StartTimeHours", "int"),
+    ("StartTimeMinutes", "int"),
+    ("EndTimeHours", "int"),
+    ("EndTimeMinutes", "int"),
+    ("DaysActive", "int"),
+    ("Recurring", "bool"),
+)
+
+
+def _add_schedule_parameters(
+    parameters_element: ET.Element,
+    is_countdown_timer: bool,
+    start_time_hours: int,
+    start_time_minutes: int,
+    end_time_hours: int,
+    end_time_minutes: int,
+    days_active: int,
+    recurring: bool,
+) -> None:
+    values = (is_countdown_timer, start_time_hours, start_time_minutes, end_time_hours, end_time_minutes, days_active, recurring)
+    for (name, data_type), value in zip(_SCHEDULE_PARAMETERS, values):
+        parameter = ET.SubElement(parameters_element, "Parameter", name=name, dataType=data_type)
+        parameter.text = str(int(value))
+
 
 class OmniLogicAPI:
     def __init__(self, controller_ip: str, controller_port: int, response_timeout: float) -> None:
         self.controller_ip = controller_ip
         self.controller_port = controller_port
         self.response_timeout = response_timeout
-        self._loop = asyncio.get_running_loop()
-        self._protocol_factory = OmniLogicProtocol
 
     @overload
-    async def async_send_message(self, message_type: MessageType, message: str | None, need_response: Literal[True]) -> str: ...
+    async def async_send_message(self, message_type: MessageType, message: str | bytes | None, need_response: Literal[True]) -> str: ...
 
     @overload
-    async def async_send_message(self, message_type: MessageType, message: str | None, need_response: Literal[False]) -> None: ...
+    async def async_send_message(self, message_type: MessageType, message: str | bytes | None, need_response: Literal[False]) -> None: ...
 
-    async def async_send_message(self, message_type: MessageType, message: str | None, need_response: bool = False) -> str | None:
+    async def async_send_message(self, message_type: MessageType, message: str | bytes | None, need_response: bool = False) -> str | None:
         """Send a message via the Hayward Omni UDP protocol along with properly handling timeouts and responses.
 
         Args:
             message_type (MessageType): A selection from MessageType indicating what type of communication you are sending
-            message (str | None): The XML body of the message to deliver
+            message (str | bytes | None): The XML body of the message to deliver
             need_response (bool, optional): Should a response be received and returned to the caller. Defaults to False.
 
         Returns:
@@ -67,14 +118,7 @@ class OmniLogicAPI:
         Returns:
             str: An XML body indicating any alarms that are present
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
-
-        name_element = ET.SubElement(body_element, "Name")
-        name_element.text = "GetAllAlarmList"
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
-
-        return await self.async_send_message(MessageType.GET_ALARM_LIST, req_body, True)
+        return await self.async_send_message(MessageType.GET_ALARM_LIST, _GET_ALARM_LIST_REQUEST, True)
 
     @to_pydantic(pydantic_type=MSPConfig)
     async def async_get_config(self) -> str:
@@ -86,14 +130,7 @@ class OmniLogicAPI:
         Returns:
             MSPConfig|str: Either a parsed .models.mspconfig.MSPConfig object or a str depending on arg raw
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
-
-        name_element = ET.SubElement(body_element, "Name")
-        name_element.text = "RequestConfiguration"
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
-
-        return await self.async_send_message(MessageType.REQUEST_CONFIGURATION, req_body, True)
+        return await self.async_send_message(MessageType.REQUEST_CONFIGURATION, _GET_CONFIG_REQUEST, True)
 
     @to_pydantic(pydantic_type=FilterDiagnostics)
     async def async_get_filter_diagnostics(
@@ -110,7 +147,7 @@ class OmniLogicAPI:
         Returns:
             FilterDiagnostics|str: Either a parsed .models.mspconfig.FilterDiagnostics object or a str depending on arg raw
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "GetUIFilterDiagnosticInfo"
@@ -121,7 +158,7 @@ class OmniLogicAPI:
         parameter = ET.SubElement(parameters_element, "Parameter", name="equipmentId", dataType="int")
         parameter.text = str(equipment_id)
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.GET_FILTER_DIAGNOSTIC_INFO, req_body, True)
 
@@ -140,14 +177,7 @@ class OmniLogicAPI:
         Returns:
             Telemetry|str: Either a parsed .models.telemetry.Telemetry object or a str depending on arg raw
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
-
-        name_element = ET.SubElement(body_element, "Name")
-        name_element.text = "RequestTelemetryData"
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
-
-        return await self.async_send_message(MessageType.GET_TELEMETRY, req_body, True)
+        return await self.async_send_message(MessageType.GET_TELEMETRY, _GET_TELEMETRY_REQUEST, True)
 
     async def async_set_heater(
         self,
@@ -162,27 +192,17 @@ class OmniLogicAPI:
             pool_id (int): The Pool/BodyOfWater ID that you want to address
             equipment_id (int): Which equipment_id within that Pool to address
             temperature (int): What temperature to request
-            unit (str): The temperature unit to use (either F or C)
+            unit (str): The temperature unit to use (either F or C, in either case)
+
+        Raises:
+            ValueError: If unit is not either F or C
 
         Returns:
             None
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
-
-        name_element = ET.SubElement(body_element, "Name")
-        name_element.text = "SetUIHeaterCmd"
-
-        parameters_element = ET.SubElement(body_element, "Parameters")
-        parameter = ET.SubElement(parameters_element, "Parameter", name="poolId", dataType="int")
-        parameter.text = str(pool_id)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="HeaterID", dataType="int", alias="EquipmentID")
-        parameter.text = str(equipment_id)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="Temp", dataType="int", unit=unit, alias="Data")
-        parameter.text = str(temperature)
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
-
-        return await self.async_send_message(MessageType.SET_HEATER_COMMAND, req_body, False)
+        return await self._async_set_heater_temperature(
+            "SetUIHeaterCmd", MessageType.SET_HEATER_COMMAND, pool_id, equipment_id, temperature, unit
+        )
 
     async def async_set_solar_heater(
         self,
@@ -197,15 +217,36 @@ class OmniLogicAPI:
             pool_id (int): The Pool/BodyOfWater ID that you want to address
             equipment_id (int): Which equipment_id within that Pool to address
             temperature (int): What temperature to request
-            unit (str): The temperature unit to use (either F or C)
+            unit (str): The temperature unit to use (either F or C, in either case)
+
+        Raises:
+            ValueError: If unit is not either F or C
 
         Returns:
             None
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        return await self._async_set_heater_temperature(
+            "SetUISolarSetPointCmd", MessageType.SET_SOLAR_SET_POINT_COMMAND, pool_id, equipment_id, temperature, unit
+        )
+
+    async def _async_set_heater_temperature(
+        self,
+        name: str,
+        message_type: MessageType,
+        pool_id: int,
+        equipment_id: int,
+        temperature: int,
+        unit: str,
+    ) -> None:
+        # Normalize the case so callers passing f or c keep working, then reject anything the Omni will not understand before we send it
+        if (unit := unit.upper()) not in _VALID_UNITS:
+            raise ValueError(f"Invalid temperature unit {unit!r}, must be one of F or C")
+
+        # The heater and solar set point commands take identical parameters, they only differ in their name and message type
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
-        name_element.text = "SetUISolarSetPointCmd"
+        name_element.text = name
 
         parameters_element = ET.SubElement(body_element, "Parameters")
         parameter = ET.SubElement(parameters_element, "Parameter", name="poolId", dataType="int")
@@ -215,9 +256,9 @@ class OmniLogicAPI:
         parameter = ET.SubElement(parameters_element, "Parameter", name="Temp", dataType="int", unit=unit, alias="Data")
         parameter.text = str(temperature)
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
-        return await self.async_send_message(MessageType.SET_SOLAR_SET_POINT_COMMAND, req_body, False)
+        return await self.async_send_message(message_type, req_body, False)
 
     async def async_set_heater_mode(
         self,
@@ -235,7 +276,7 @@ class OmniLogicAPI:
         Returns:
             None
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetUIHeaterModeCmd"
@@ -248,7 +289,7 @@ class OmniLogicAPI:
         parameter = ET.SubElement(parameters_element, "Parameter", name="Mode", dataType="int", alias="Data")
         parameter.text = str(mode.value)
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.SET_HEATER_MODE_COMMAND, req_body, False)
 
@@ -268,7 +309,7 @@ class OmniLogicAPI:
         Returns:
             _type_: _description_
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetHeaterEnable"
@@ -281,7 +322,7 @@ class OmniLogicAPI:
         parameter = ET.SubElement(parameters_element, "Parameter", name="Enabled", dataType="bool", alias="Data")
         parameter.text = str(int(enabled))
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.SET_HEATER_ENABLED, req_body, False)
 
@@ -314,7 +355,7 @@ class OmniLogicAPI:
             daysActive (int, optional): For potential future use, included to be "API complete". Defaults to 0.
             recurring (bool, optional): For potential future use, included to be "API complete". Defaults to False.
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetUIEquipmentCmd"
@@ -326,22 +367,18 @@ class OmniLogicAPI:
         parameter.text = str(equipment_id)
         parameter = ET.SubElement(parameters_element, "Parameter", name="isOn", dataType="int", alias="Data")
         parameter.text = str(int(is_on))
-        parameter = ET.SubElement(parameters_element, "Parameter", name="IsCountDownTimer", dataType="bool")
-        parameter.text = str(int(is_countdown_timer))
-        parameter = ET.SubElement(parameters_element, "Parameter", name="StartTimeHours", dataType="int")
-        parameter.text = str(start_time_hours)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="StartTimeMinutes", dataType="int")
-        parameter.text = str(start_time_minutes)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="EndTimeHours", dataType="int")
-        parameter.text = str(end_time_hours)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="EndTimeMinutes", dataType="int")
-        parameter.text = str(end_time_minutes)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="DaysActive", dataType="int")
-        parameter.text = str(days_active)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="Recurring", dataType="bool")
-        parameter.text = str(int(recurring))
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        _add_schedule_parameters(
+            parameters_element,
+            is_countdown_timer,
+            start_time_hours,
+            start_time_minutes,
+            end_time_hours,
+            end_time_minutes,
+            days_active,
+            recurring,
+        )
+
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.SET_EQUIPMENT, req_body, False)
 
@@ -353,7 +390,7 @@ class OmniLogicAPI:
             equipment_id (int): Which equipment_id within that Pool to address
             speed (int): Speed value from 0-100 to set the filter to.  A value of 0 will turn the filter off.
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetUIFilterSpeedCmd"
@@ -367,7 +404,7 @@ class OmniLogicAPI:
         parameter = ET.SubElement(parameters_element, "Parameter", name="Speed", dataType="int", unit="RPM", alias="Data")
         parameter.text = str(speed)
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.SET_FILTER_SPEED, req_body, False)
 
@@ -404,7 +441,7 @@ class OmniLogicAPI:
             days_active (int, optional): For potential future use, included to be "API complete". Defaults to 0.
             recurring (bool, optional): For potential future use, included to be "API complete". Defaults to False.
         """
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetStandAloneLightShow"
@@ -422,26 +459,22 @@ class OmniLogicAPI:
         parameter.text = str(brightness.value)
         parameter = ET.SubElement(parameters_element, "Parameter", name="Reserved", dataType="byte")
         parameter.text = str(reserved)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="IsCountDownTimer", dataType="bool")
-        parameter.text = str(int(is_countdown_timer))
-        parameter = ET.SubElement(parameters_element, "Parameter", name="StartTimeHours", dataType="int")
-        parameter.text = str(start_time_hours)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="StartTimeMinutes", dataType="int")
-        parameter.text = str(start_time_minutes)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="EndTimeHours", dataType="int")
-        parameter.text = str(end_time_hours)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="EndTimeMinutes", dataType="int")
-        parameter.text = str(end_time_minutes)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="DaysActive", dataType="int")
-        parameter.text = str(days_active)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="Recurring", dataType="bool")
-        parameter.text = str(int(recurring))
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        _add_schedule_parameters(
+            parameters_element,
+            is_countdown_timer,
+            start_time_hours,
+            start_time_minutes,
+            end_time_hours,
+            end_time_minutes,
+            days_active,
+            recurring,
+        )
+
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
         return await self.async_send_message(MessageType.SET_STANDALONE_LIGHT_SHOW, req_body, False)
 
     async def async_set_chlorinator_enable(self, pool_id: int, enabled: int | bool) -> None:
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetCHLOREnable"
@@ -452,7 +485,7 @@ class OmniLogicAPI:
         parameter = ET.SubElement(parameters_element, "Parameter", name="Enabled", dataType="bool", alias="Data")
         parameter.text = str(int(enabled))
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.SET_CHLOR_ENABLED, req_body, False)
 
@@ -468,7 +501,7 @@ class OmniLogicAPI:
         orp_timeout: int,
         cfg_state: int = 3,
     ) -> None:
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetCHLORParams"
@@ -493,7 +526,7 @@ class OmniLogicAPI:
         parameter = ET.SubElement(parameters_element, "Parameter", name="ORPTimout", dataType="byte", unit="hour", alias="Data7")
         parameter.text = str(orp_timeout)
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.SET_CHLOR_PARAMS, req_body, False)
 
@@ -503,7 +536,7 @@ class OmniLogicAPI:
         equipment_id: int,
         enabled: int | bool,
     ) -> None:
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetUISuperCHLORCmd"
@@ -516,21 +549,12 @@ class OmniLogicAPI:
         parameter = ET.SubElement(parameters_element, "Parameter", name="IsOn", dataType="byte", alias="Data1")
         parameter.text = str(int(enabled))
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.SET_SUPERCHLORINATE, req_body, False)
 
     async def async_restore_idle_state(self) -> None:
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
-
-        name_element = ET.SubElement(body_element, "Name")
-        name_element.text = "RestoreIdleState"
-
-        ET.SubElement(body_element, "Parameters")
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
-
-        return await self.async_send_message(MessageType.RESTORE_IDLE_STATE, req_body, False)
+        return await self.async_send_message(MessageType.RESTORE_IDLE_STATE, _RESTORE_IDLE_STATE_REQUEST, False)
 
     async def async_set_spillover(
         self,
@@ -544,7 +568,7 @@ class OmniLogicAPI:
         days_active: int = 0,
         recurring: bool = False,
     ) -> None:
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "SetUISpilloverCmd"
@@ -554,22 +578,18 @@ class OmniLogicAPI:
         parameter.text = str(pool_id)
         parameter = ET.SubElement(parameters_element, "Parameter", name="Speed", dataType="int")
         parameter.text = str(speed)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="IsCountDownTimer", dataType="bool")
-        parameter.text = str(int(is_countdown_timer))
-        parameter = ET.SubElement(parameters_element, "Parameter", name="StartTimeHours", dataType="int")
-        parameter.text = str(start_time_hours)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="StartTimeMinutes", dataType="int")
-        parameter.text = str(start_time_minutes)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="EndTimeHours", dataType="int")
-        parameter.text = str(end_time_hours)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="EndTimeMinutes", dataType="int")
-        parameter.text = str(end_time_minutes)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="DaysActive", dataType="int")
-        parameter.text = str(days_active)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="Recurring", dataType="bool")
-        parameter.text = str(int(recurring))
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        _add_schedule_parameters(
+            parameters_element,
+            is_countdown_timer,
+            start_time_hours,
+            start_time_minutes,
+            end_time_hours,
+            end_time_minutes,
+            days_active,
+            recurring,
+        )
+
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.SET_SPILLOVER, req_body, False)
 
@@ -585,7 +605,7 @@ class OmniLogicAPI:
         days_active: int = 0,
         recurring: bool = False,
     ) -> None:
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+        body_element = ET.Element("Request", _REQUEST_ATTRIBUTES)
 
         name_element = ET.SubElement(body_element, "Name")
         name_element.text = "RunGroupCmd"
@@ -595,21 +615,17 @@ class OmniLogicAPI:
         parameter.text = str(group_id)
         parameter = ET.SubElement(parameters_element, "Parameter", name="Data", dataType="int")
         parameter.text = str(int(enabled))
-        parameter = ET.SubElement(parameters_element, "Parameter", name="IsCountDownTimer", dataType="bool")
-        parameter.text = str(int(is_countdown_timer))
-        parameter = ET.SubElement(parameters_element, "Parameter", name="StartTimeHours", dataType="int")
-        parameter.text = str(start_time_hours)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="StartTimeMinutes", dataType="int")
-        parameter.text = str(start_time_minutes)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="EndTimeHours", dataType="int")
-        parameter.text = str(end_time_hours)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="EndTimeMinutes", dataType="int")
-        parameter.text = str(end_time_minutes)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="DaysActive", dataType="int")
-        parameter.text = str(days_active)
-        parameter = ET.SubElement(parameters_element, "Parameter", name="Recurring", dataType="bool")
-        parameter.text = str(int(recurring))
-
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
+        _add_schedule_parameters(
+            parameters_element,
+            is_countdown_timer,
+            start_time_hours,
+            start_time_minutes,
+            end_time_hours,
+            end_time_minutes,
+            days_active,
+            recurring,
+        )
+
+        req_body = ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
 
         return await self.async_send_message(MessageType.RUN_GROUP_CMD, req_body, False)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, SupportsInt, TypeAlias, TypeVar, cast, overload
 
-from pydantic.v1 import BaseModel, Field, ValidationError
+from pydantic.v1 import BaseModel, Field, PrivateAttr, ValidationError
 from xmltodict import parse as xml_parse
 
 from ..exceptions import OmniParsingException
@@ -190,10 +190,24 @@ class Telemetry(BaseModel):
     relay: list[TelemetryRelay] | None = Field(alias="Relay")
     valve_actuator: list[TelemetryValveActuator] | None = Field(alias="ValveActuator")
     virtual_heater: list[TelemetryVirtualHeater] | None = Field(alias="VirtualHeater")
+    # Index of the telemetry entries by system_id, built the first time get_telem_by_systemid is called
+    _telem_by_systemid: dict[int, TelemetryType] | None = PrivateAttr(default=None)
 
     class Config:
         orm_mode = True
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Re-assigning a piece of equipment would leave the index pointing at the old telemetry, so drop it and let the next lookup rebuild it
+        if name in self.__fields__:
+            self._telem_by_systemid = None
+
+    def copy(self, *args: Any, **kwargs: Any) -> Telemetry:
+        # Pydantic carries private attributes over to the copy as-is, but update= may have replaced the equipment that the index points at
+        telemetry = super().copy(*args, **kwargs)
+        telemetry._telem_by_systemid = None  # pylint: disable=protected-access
+        return telemetry
+
     @staticmethod
     def load_xml(xml: str) -> Telemetry:
         TypeVar("KT")
@@ -249,16 +263,30 @@ class Telemetry(BaseModel):
             raise OmniParsingException(f"Failed to parse Telemetry: {exc}") from exc
 
     def get_telem_by_systemid(self, system_id: int) -> TelemetryType | None:
-        for field_name, value in self:
-            if field_name == "version" or value is None:
-                continue
-            if isinstance(value, list):
-                for model in value:
-                    cast_model = cast(TelemetryType, model)
-                    if cast_model.system_id == system_id:
-                        return cast_model
-            else:
-                cast_model = cast(TelemetryType, value)
-                if cast_model.system_id == system_id:
-                    return cast_model
-        return None
+        """Get the telemetry for a piece of equipment by its system_id.
+
+        The lookup index is built on first use and dropped whenever a field is re-assigned, changes made to the equipment lists in place
+        (E.g.: telemetry.filter.clear()) are not reflected in it.
+
+        Args:
+            system_id (int): The system_id of the equipment to look up
+
+        Returns:
+            TelemetryType | None: The telemetry for that equipment, or None if there is none
+        """
+        # Looking up telemetry for every piece of equipment would otherwise walk every field of the model each time, so we walk it once
+        # and index the results.  If the same system_id somehow shows up twice, the first entry wins, same as a linear search would.
+        if self._telem_by_systemid is None:
+            telem_by_systemid: dict[int, TelemetryType] = {}
+            for field_name, value in self:
+                if field_name == "version" or value is None:
+                    continue
+                if isinstance(value, list):
+                    for model in value:
+                        cast_model = cast(TelemetryType, model)
+                        telem_by_systemid.setdefault(cast_model.system_id, cast_model)
+                else:
+                    cast_model = cast(TelemetryType, value)
+                    telem_by_systemid.setdefault(cast_model.system_id, cast_model)
+            self._telem_by_systemid = telem_by_systemid
+        return self._telem_by_systemid.get(system_id)
@@ -15,7 +15,7 @@ _LOGGER = logging.getLogger(__name__)
 class ParameterGetter(GetterDict):
     def get(self, key: str, default: Any = None) -> Any:
         try:
-            return self._obj.find(f".//api:Parameter[@name='{key}']", XML_NS).text
+            return self._obj.find(f"./api:Parameters/api:Parameter[@name='{key}']", XML_NS).text
         except AttributeError:
             return default
 
@@ -1,6 +1,8 @@
 import asyncio
 import logging
 import random
+import re
+import socket
 import struct
 import time
 import xml.etree.ElementTree as ET
@@ -16,38 +18,83 @@ from .omnitypes import ClientType, MessageType
 _LOGGER = logging.getLogger(__name__)
 
 
+def _build_ack_body() -> bytes:
+    body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
+    name_element = ET.SubElement(body_element, "Name")
+    name_element.text = "Ack"
+
+    return ET.tostring(body_element, xml_declaration=True, encoding="utf-8")
+
+
+# The body of an ACK never changes, so we only build it once instead of for every message that we acknowledge
+_ACK_BODY = _build_ack_body()
+
+
+# The block count is the only thing we need out of a LeadMessage, and the LeadMessage is small and always has the same layout, so we can
+# pull it straight out of the raw payload without building an XML tree
+_BLOCK_COUNT_RE = re.compile(rb'name="MsgBlockCount"[^>]*>\s*(\d+)\s*<')
+
+
+def _get_block_count(payload: bytes) -> int:
+    """Get the number of BlockMessages that will follow a LeadMessage.
+
+    Args:
+        payload (bytes): The raw, null terminated, payload of an MSP LeadMessage
+
+    Returns:
+        int: The MsgBlockCount from the LeadMessage
+    """
+    if (match := _BLOCK_COUNT_RE.search(payload)) is not None:
+        return int(match.group(1))
+    # Fall back to fully parsing the LeadMessage if it is not laid out the way that we expect
+    return LeadMessage.from_orm(ET.fromstring(payload[:-1])).msg_block_count
+
+
 class OmniLogicMessage:
     header_format = "!LQ4sLBBBB"
+    # Compile the header format once, it is used to pack/unpack every datagram we send or receive
+    header_struct = struct.Struct(header_format)
+    # A message is created for every datagram we send or receive, slots keep them small and their attribute access fast
+    __slots__ = ("id", "type", "payload", "client_type", "version", "timestamp", "reserved_1", "compressed", "reserved_2")
     id: int
     type: MessageType
     payload: bytes
-    client_type: ClientType = ClientType.SIMPLE
-    version: str = "1.19"
-    timestamp: int | None = int(time.time())
-    reserved_1: int = 0
-    compressed: bool = False
-    reserved_2: int = 0
+    client_type: ClientType
+    version: str
+    timestamp: int | None
+    reserved_1: int
+    compressed: bool
+    reserved_2: int
 
     def __init__(
         self,
         msg_id: int,
         msg_type: MessageType,
-        payload: str | None = None,
+        payload: str | bytes | None = None,
         version: str = "1.19",
     ) -> None:
         self.id = msg_id
         self.type = msg_type
         # If we are speaking the XML API, it seems like we need client_type 0, otherwise we need client_type 1
-        self.client_type = ClientType.XML if payload is not None else ClientType.SIMPLE
-        # The Hayward API terminates it's messages with a null character
-        payload = f"{payload}\x00" if payload is not None else ""
-        self.payload = bytes(payload, "utf-8")
+        if payload is None:
+            self.client_type = ClientType.SIMPLE
+            self.payload = b""
+        else:
+            self.client_type = ClientType.XML
+            # Request bodies are usually serialized straight to UTF-8 bytes, only encode the ones that were handed to us as a str
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+            # The Hayward API terminates it's messages with a null character
+            self.payload = payload + b"\x00"
 
         self.version = version
+        self.timestamp = int(time.time())
+        self.reserved_1 = 0
+        self.compressed = False
+        self.reserved_2 = 0
 
     def __bytes__(self) -> bytes:
-        header = struct.pack(
-            self.header_format,
+        header = self.header_struct.pack(
             self.id,  # Msg id
             self.timestamp,
             bytes(self.version, "ascii"),  # version string
@@ -69,11 +116,10 @@ class OmniLogicMessage:
 
     @classmethod
     def from_bytes(cls, data: bytes) -> Self:
-        # split the header and data
-        header = data[:24]
-        rdata: bytes = data[24:]
+        # split the header and data, the header is unpacked in place to avoid copying it out of the datagram
+        (msg_id, tstamp, vers, msg_type, client_type, res1, compressed, res2) = cls.header_struct.unpack_from(data)
+        rdata: bytes = data[cls.header_struct.size :]
 
-        (msg_id, tstamp, vers, msg_type, client_type, res1, compressed, res2) = struct.unpack(cls.header_format, header)
         message = cls(msg_id=msg_id, msg_type=MessageType(msg_type), version=vers.decode("utf-8"))
         message.timestamp = tstamp
         message.client_type = ClientType(int(client_type))
@@ -92,71 +138,91 @@ class OmniLogicProtocol(asyncio.DatagramProtocol):
     _omni_retransmit_time = 2.1
     # The omni will re-transmit 5 times (a total of 6 attempts including the initial) if it does not receive an ACK
     _omni_retransmit_count = 5
+    # Size of the socket receive buffer that we request from the kernel
+    _receive_buffer_size = 1 << 20
 
     def __init__(self) -> None:
         self.data_queue = asyncio.Queue[OmniLogicMessage]()
+        # Futures for messages that are waiting on an ACK, keyed by the id of the message that we sent
+        self._ack_waiters: dict[int, asyncio.Future[None]] = {}
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         self.transport = cast(asyncio.DatagramTransport, transport)
 
+        # Give the kernel enough room to hold a burst of BlockMessages from the Omni so they are not dropped while we are busy, the kernel
+        # may cap this at net.core.rmem_max, which is fine, we are just asking for more than the default
+        if (sock := self.transport.get_extra_info("socket")) is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._receive_buffer_size)
+            except OSError as exc:
+                _LOGGER.debug("Unable to increase the socket receive buffer size: %s", exc)
+
     def connection_lost(self, exc: Exception | None) -> None:
         if exc:
             raise exc
 
     def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
         message = OmniLogicMessage.from_bytes(data)
-        _LOGGER.debug("Received Message %s", str(message))
+        _LOGGER.debug("Received Message %s", message)
+
+        # If someone is waiting on an ACK for this id, hand the message straight to them instead of queueing it
+        if (waiter := self._ack_waiters.pop(message.id, None)) is not None:
+            if not waiter.done():
+                waiter.set_result(None)
+            return
+
+        # If the message that we received was either a LEADMESSAGE or a TELEMETRY UPDATE while we are waiting on an ACK, the ACK was
+        # dropped.  The Omni is continuing on with life, lets not be clingy for an ACK that will never come.
+        # The set below should include any message types that may be sent immediately after the Omni sends us an ACK.
+        # Example is:
+        # Us > Omni: MessageType.REQUEST_CONFIGURATION
+        # Omni > Us: MessageType.ACK
+        # Omni > Us: MessageType.MSP_LEADMESSAGE  <--- Sent immediately after an ACK
+        if self._ack_waiters and message.type in {MessageType.MSP_LEADMESSAGE, MessageType.MSP_TELEMETRY_UPDATE}:
+            _LOGGER.debug("We received a message that is not our ACK, it appears the ACK was dropped, continuing on with the communication")
+            for pending in self._ack_waiters.values():
+                if not pending.done():
+                    pending.set_result(None)
+            self._ack_waiters.clear()
+
         self.data_queue.put_nowait(message)
 
     def error_received(self, exc: Exception) -> None:
         raise exc
 
-    async def _wait_for_ack(self, ack_id: int) -> None:
-        message = await self.data_queue.get()
-        while message.id != ack_id:
-            _LOGGER.debug("We received a message that is not our ACK, it appears the ACK was dropped")
-            # If the message that we received was either a LEADMESSAGE or a BLOCK MESSAGE, lets put it back and return,
-            # The Omni is continuing on with life, lets not be clingy for an ACK that was dropped and will never come
-            # We will put this new message back into the queue and stop waiting for our ACK.
-            # The set below should include any message types that may be sent immediately after the Omni sends us an ACK.
-            # Example is:
-            # Us > Omni: MessageType.REQUEST_CONFIGURATION
-            # Omni > Us: MessageType.ACK
-            # Omni > Us: MessageType.MSP_LEADMESSAGE  <--- Sent immediately after an ACK
-            if message.type in {MessageType.MSP_LEADMESSAGE, MessageType.MSP_TELEMETRY_UPDATE}:
-                _LOGGER.debug("Omni has sent a new message, continuing on with the communication")
-                await self.data_queue.put(message)
-                break
-            # In theory, we should never get to this spot, but it's mostly here to cause the code to wait forever so that asyncio will
-            # eventually time out waiting for it, that way we can deal with the dropped packets
-            message = await self.data_queue.get()
-
     async def _ensure_sent(
         self,
         message: OmniLogicMessage,
         max_attempts: int = 5,
     ) -> None:
-        for attempt in range(0, max_attempts):
+        # If the message that we are sending is an ACK, we do not need to wait to receive an ACK
+        if message.type in [MessageType.XML_ACK, MessageType.ACK]:
             self.transport.sendto(bytes(message))
+            return
 
-            # If the message that we just sent is an ACK, we do not need to wait to receive an ACK, we are done
-            if message.type in [MessageType.XML_ACK, MessageType.ACK]:
-                return
+        ack = asyncio.get_running_loop().create_future()
+        self._ack_waiters[message.id] = ack
+        try:
+            for attempt in range(0, max_attempts):
+                self.transport.sendto(bytes(message))
 
-            # Wait for a bit to either receive an ACK for our message, otherwise, we retry delivery
-            try:
-                await asyncio.wait_for(self._wait_for_ack(message.id), 0.5)
-                return
-            except TimeoutError as exc:
-                if attempt < 4:
-                    _LOGGER.debug("ACK not received, re-attempting delivery")
-                else:
-                    raise OmniTimeoutException("Failed to receive acknowledgement of command, max retries exceeded") from exc
+                # Wait for a bit to either receive an ACK for our message, otherwise, we retry delivery.  The future is shielded so that
+                # a timeout does not cancel it, an ACK for an earlier attempt is just as good as one for this attempt.
+                try:
+                    await asyncio.wait_for(asyncio.shield(ack), 0.5)
+                    return
+                except asyncio.TimeoutError as exc:
+                    if attempt < max_attempts - 1:
+                        _LOGGER.debug("ACK not received, re-attempting delivery")
+                    else:
+                        raise OmniTimeoutException("Failed to receive acknowledgement of command, max retries exceeded") from exc
+        finally:
+            self._ack_waiters.pop(message.id, None)
 
     async def send_and_receive(
         self,
         msg_type: MessageType,
-        payload: str | None,
+        payload: str | bytes | None,
         msg_id: int | None = None,
     ) -> str:
         await self.send_message(msg_type, payload, msg_id)
@@ -166,55 +232,53 @@ class OmniLogicProtocol(asyncio.DatagramProtocol):
     async def send_message(
         self,
         msg_type: MessageType,
-        payload: str | None,
+        payload: str | bytes | None,
         msg_id: int | None = None,
     ) -> None:
-        # If we aren't sending a specific msg_id, lets randomize it
+        # If we aren't sending a specific msg_id, lets randomize it.  getrandbits pulls the 32 bits directly instead of going through
+        # randrange's range reduction
         if not msg_id:
-            msg_id = random.randrange(2**32)
+            msg_id = random.getrandbits(32)
 
         message = OmniLogicMessage(msg_id, msg_type, payload)
 
-        _LOGGER.debug("Sending Message %s", str(message))
+        _LOGGER.debug("Sending Message %s", message)
 
         await self._ensure_sent(message)
 
     async def _send_ack(self, msg_id: int) -> None:
-        body_element = ET.Element("Request", {"xmlns": "http://nextgen.hayward.com/api"})
-        name_element = ET.SubElement(body_element, "Name")
-        name_element.text = "Ack"
+        await self.send_message(MessageType.XML_ACK, _ACK_BODY, msg_id)
 
-        req_body = ET.tostring(body_element, xml_declaration=True, encoding="unicode")
-        await self.send_message(MessageType.XML_ACK, req_body, msg_id)
+    async def _get_message(self) -> OmniLogicMessage:
+        # We need to wait long enough for the Omni to get through all of it's retries before we bail out.
+        try:
+            return await asyncio.wait_for(self.data_queue.get(), self._omni_retransmit_time * self._omni_retransmit_count)
+        except asyncio.TimeoutError as exc:
+            raise OmniTimeoutException("Timed out waiting for a message from the Omni") from exc
 
     async def _receive_file(self) -> str:
         # wait for the initial packet.
-        message = await self.data_queue.get()
+        message = await self._get_message()
 
         # If messages have to be re-transmitted, we can sometimes receive multiple ACKs.  The first one would be handled by
         # self._ensure_sent, but if any subsequent ACKs are sent to us, we need to dump them and wait for a "real" message.
         while message.type in [MessageType.ACK, MessageType.XML_ACK]:
-            message = await self.data_queue.get()
+            message = await self._get_message()
 
         await self._send_ack(message.id)
 
         # If the response is too large, the controller will send a LeadMessage indicating how many follow-up messages will be sent
         if message.type is MessageType.MSP_LEADMESSAGE:
-            leadmsg = LeadMessage.from_orm(ET.fromstring(message.payload[:-1]))
+            block_count = _get_block_count(message.payload)
 
-            _LOGGER.debug("Will receive %s blockmessages", leadmsg.msg_block_count)
+            _LOGGER.debug("Will receive %s blockmessages", block_count)
 
             # Wait for the block data data
-            retval: bytes = b""
             # If we received a LeadMessage, continue to receive messages until we have all of our data
             # Fragments of data may arrive out of order, so we store them in a buffer as they arrive and sort them after
-            data_fragments: dict[int, bytes] = {}
-            while len(data_fragments) < leadmsg.msg_block_count:
-                # We need to wait long enough for the Omni to get through all of it's retries before we bail out.
-                try:
-                    resp = await asyncio.wait_for(self.data_queue.get(), self._omni_retransmit_time * self._omni_retransmit_count)
-                except TimeoutError as exc:
-                    raise OmniTimeoutException from exc
+            data_fragments: dict[int, memoryview] = {}
+            while len(data_fragments) < block_count:
+                resp = await self._get_message()
 
                 # We only want to collect blockmessages here
                 if resp.type is not MessageType.MSP_BLOCKMESSAGE:
@@ -223,12 +287,11 @@ class OmniLogicProtocol(asyncio.DatagramProtocol):
 
                 await self._send_ack(resp.id)
 
-                # remove an 8 byte header to get to the payload data
-                data_fragments[resp.id] = resp.payload[8:]
+                # remove an 8 byte header to get to the payload data, a memoryview lets us do that without copying the fragment
+                data_fragments[resp.id] = memoryview(resp.payload)[8:]
 
-            # Reassemble the fragmets in order
-            for _, data in sorted(data_fragments.items()):
-                retval += data
+            # Reassemble the fragments in order, joining them in one pass rather than growing a bytes object per fragment
+            retval = b"".join(data for _, data in sorted(data_fragments.items()))
 
         # We did not receive a LeadMessage, so our payload is just this one packet
         else:
@@ -236,8 +299,7 @@ class OmniLogicProtocol(asyncio.DatagramProtocol):
 
         # Decompress the returned data if necessary
         if message.compressed:
-            comp_bytes = bytes.fromhex(retval.hex())
-            retval = zlib.decompress(comp_bytes)
+            retval = zlib.decompress(retval)
 
         # For some API calls, the Omni null terminates the response, we are stripping that here to make parsing it later easier
         return retval.decode("utf-8").strip("\x00")
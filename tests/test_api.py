@@ -0,0 +1,40 @@
+import asyncio
+import xml.etree.ElementTree as ET
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pyomnilogic_local.api import OmniLogicAPI
+from pyomnilogic_local.models.const import XML_NS
+from pyomnilogic_local.omnitypes import MessageType
+
+
+def test_set_heater_rejects_invalid_unit() -> None:
+    """Validate that the heater setters reject a temperature unit that the Omni does not understand before sending anything."""
+    api = OmniLogicAPI("127.0.0.1", 10444, 5.0)
+
+    with patch.object(api, "async_send_message", AsyncMock()) as send:
+        with pytest.raises(ValueError):
+            asyncio.run(api.async_set_heater(7, 8, 80, "K"))
+        with pytest.raises(ValueError):
+            asyncio.run(api.async_set_solar_heater(7, 8, 80, "kelvin"))
+    send.assert_not_called()
+
+
+@pytest.mark.parametrize(("unit", "expected"), [("F", "F"), ("C", "C"), ("f", "F"), ("c", "C")])
+def test_set_heater_sends_unit(unit: str, expected: str) -> None:
+    """Validate that the heater setters accept F or C in either case and send it upper case on the Temp parameter."""
+    api = OmniLogicAPI("127.0.0.1", 10444, 5.0)
+
+    with patch.object(api, "async_send_message", AsyncMock()) as send:
+        asyncio.run(api.async_set_heater(7, 8, 80, unit))
+        asyncio.run(api.async_set_solar_heater(7, 8, 90, unit))
+
+    for call, message_type, temperature in zip(
+        send.call_args_list, (MessageType.SET_HEATER_COMMAND, MessageType.SET_SOLAR_SET_POINT_COMMAND), ("80", "90")
+    ):
+        assert call.args[0] is message_type
+        temp = ET.fromstring(call.args[1]).find("./api:Parameters/api:Parameter[@name='Temp']", XML_NS)
+        assert temp is not None
+        assert temp.get("unit") == expected
+        assert temp.text == temperature
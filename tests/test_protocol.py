@@ -1,5 +1,13 @@
+import asyncio
+import socket
+from typing import Any
+
 from pyomnilogic_local.omnitypes import ClientType, MessageType
-from pyomnilogic_local.protocol import OmniLogicMessage
+from pyomnilogic_local.protocol import (
+    OmniLogicMessage,
+    OmniLogicProtocol,
+    _get_block_count,
+)
 
 
 def test_parse_basic_ack() -> None:
@@ -59,3 +67,100 @@ def test_create_leadmessage() -> None:
     message.timestamp = 1685492417
     message.compressed = True
     assert bytes(message) == bytes_leadmessage
+
+
+class FakeSocket:
+    """Stand-in for a socket that records the options set on it, optionally refusing them."""
+
+    def __init__(self, error: OSError | None = None) -> None:
+        self.error = error
+        self.options: dict[tuple[int, int], int] = {}
+
+    def setsockopt(self, level: int, option: int, value: int) -> None:
+        if self.error is not None:
+            raise self.error
+        self.options[(level, option)] = value
+
+
+class FakeTransport:
+    """Stand-in for an asyncio.DatagramTransport that records what was sent."""
+
+    def __init__(self, sock: FakeSocket | None = None) -> None:
+        self.sent: list[bytes] = []
+        self.sock = sock
+
+    def sendto(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        if name == "socket" and self.sock is not None:
+            return self.sock
+        return default
+
+
+def send_with_reply(msg_id: int, reply: bytes) -> OmniLogicProtocol:
+    """Send a message, feed reply back to the protocol as if the Omni sent it, and return the protocol once the send completes."""
+
+    async def run() -> OmniLogicProtocol:
+        protocol = OmniLogicProtocol()
+        protocol.connection_made(FakeTransport())  # type: ignore[arg-type]
+        send = asyncio.create_task(protocol.send_message(MessageType.REQUEST_CONFIGURATION, None, msg_id=msg_id))
+        await asyncio.sleep(0)
+        protocol.datagram_received(reply, ("127.0.0.1", 10444))
+        await send
+        return protocol
+
+    return asyncio.run(run())
+
+
+def test_connection_made_sets_receive_buffer() -> None:
+    """Validate that we ask the kernel for a larger receive buffer when the transport exposes its socket"""
+    sock = FakeSocket()
+    protocol = OmniLogicProtocol()
+    protocol.connection_made(FakeTransport(sock))  # type: ignore[arg-type]
+    assert sock.options == {(socket.SOL_SOCKET, socket.SO_RCVBUF): OmniLogicProtocol._receive_buffer_size}
+
+
+def test_connection_made_ignores_receive_buffer_error() -> None:
+    """Validate that a socket refusing the larger receive buffer does not stop the connection from being made"""
+    sock = FakeSocket(OSError("not permitted"))
+    protocol = OmniLogicProtocol()
+    protocol.connection_made(FakeTransport(sock))  # type: ignore[arg-type]
+    assert not sock.options
+
+
+def test_ack_completes_send() -> None:
+    """Validate that an ACK carrying our message id completes a send without being queued"""
+    bytes_ack = b"\x99_\xd1l\x00\x00\x00\x00dv\x8f\xc11.20\x00\x00\x03\xea\x03\x00\x00\x00"
+    protocol = send_with_reply(2573193580, bytes_ack)
+    assert protocol.data_queue.empty()
+    assert not protocol._ack_waiters
+
+
+def test_get_block_count() -> None:
+    """Validate that we can read the block count out of an MSP LeadMessage, with or without the fast path"""
+    payload_leadmessage = (
+        b'<?xml version="1.0" encoding="UTF-8" ?><Response xmlns="http://nextgen.hayward.com/api"><Name>LeadMessage</Name><Parameters>'
+        b'<Parameter name="SourceOpId" dataType="int">1003</Parameter><Parameter name="MsgSize" dataType="int">3361</Parameter>'
+        b'<Parameter name="MsgBlockCount" dataType="int">4</Parameter><Parameter name="Type" dataType="int">0</Parameter></Parameters>'
+        b"</Response>\x00"
+    )
+    assert _get_block_count(payload_leadmessage) == 4
+    # Attributes in a different order/quoting style should still parse by falling back to the full XML parser
+    reordered_leadmessage = payload_leadmessage.replace(b'name="MsgBlockCount" dataType="int"', b"dataType='int' name='MsgBlockCount'")
+    assert _get_block_count(reordered_leadmessage) == 4
+
+
+def test_leadmessage_completes_send() -> None:
+    """Validate that a LeadMessage arriving in place of a dropped ACK completes a send and is kept for the response"""
+    bytes_leadmessage = (
+        b'\x00\x00\x90v\x00\x00\x00\x00dv\x92\xc11.20\x00\x00\x07\xce\x03\x00\x01\x00<?xml version="1.0" encoding="UTF-8" ?>'
+        b'<Response xmlns="http://nextgen.hayward.com/api"><Name>LeadMessage</Name><Parameters>'
+        b'<Parameter name="SourceOpId" dataType="int">1003</Parameter><Parameter name="MsgSize" dataType="int">3361</Parameter>'
+        b'<Parameter name="MsgBlockCount" dataType="int">4</Parameter><Parameter name="Type" dataType="int">0</Parameter>'
+        b"</Parameters></Response>\x00"
+    )
+
+    protocol = send_with_reply(1234, bytes_leadmessage)
+    assert protocol.data_queue.qsize() == 1
+    assert protocol.data_queue.get_nowait().type is MessageType.MSP_LEADMESSAGE
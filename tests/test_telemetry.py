@@ -0,0 +1,45 @@
+from pyomnilogic_local.models.telemetry import (
+    Telemetry,
+    TelemetryBackyard,
+    TelemetryFilter,
+)
+
+TELEMETRY_XML = """<?xml version="1.0" encoding="UTF-8" ?>
+<STATUS version="1.11">
+    <Backyard systemId="0" statusVersion="11" airTemp="77" state="1" ConfigChksum="2211028" mspVersion="R0408000" />
+    <BodyOfWater systemId="7" waterTemp="-1" flow="255" />
+    <Filter systemId="8" filterState="0" filterSpeed="0" valvePosition="1" whyFilterIsOn="0" fpOverride="0" reportedFilterSpeed="0" power="0" lastSpeed="50" />
+    <ValveActuator systemId="9" valveActuatorState="0" whyOn="0" />
+    <ColorLogic-Light systemId="10" lightState="6" currentShow="0" speed="4" brightness="4" specialEffect="0" />
+    <VirtualHeater systemId="18" Current-Set-Point="85" enable="1" SolarSetPoint="90" Mode="0" SilentMode="0" whyHeaterIsOn="1" />
+    <Heater systemId="19" heaterState="0" temp="74" enable="1" priority="254" maintainFor="24" />
+    <Group systemId="21" groupState="0" />
+</STATUS>
+"""  # noqa: E501
+
+
+def test_get_telem_by_systemid() -> None:
+    """Validate that we can look up telemetry for both list and single entry equipment by system_id"""
+    telemetry = Telemetry.load_xml(TELEMETRY_XML)
+    assert isinstance(telemetry.get_telem_by_systemid(0), TelemetryBackyard)
+    filter_telem = telemetry.get_telem_by_systemid(8)
+    assert isinstance(filter_telem, TelemetryFilter)
+    assert filter_telem.last_speed == 50
+    assert telemetry.get_telem_by_systemid(99) is None
+    # The index used for lookups is private and should not leak into the model's data
+    assert "_telem_by_systemid" not in telemetry.dict()
+
+
+def test_get_telem_by_systemid_follows_changes() -> None:
+    """Validate that lookups by system_id reflect copies and re-assigned equipment instead of returning stale telemetry"""
+    telemetry = Telemetry.load_xml(TELEMETRY_XML)
+    assert isinstance(telemetry.get_telem_by_systemid(8), TelemetryFilter)
+
+    copied = telemetry.copy(update={"filter": None})
+    assert copied.get_telem_by_systemid(8) is None
+    # The original is untouched by the copy
+    assert isinstance(telemetry.get_telem_by_systemid(8), TelemetryFilter)
+
+    telemetry.filter = None
+    assert telemetry.get_telem_by_systemid(8) is None
+    assert isinstance(telemetry.get_telem_by_systemid(0), TelemetryBackyard)